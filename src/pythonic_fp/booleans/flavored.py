@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import threading
+import sys
 from collections.abc import Hashable
 from typing import ClassVar, final, Self
 from .subtypable import SBool
@@ -20,6 +20,21 @@ from .subtypable import SBool
 __all__ = ['FBool', 'truthy', 'falsy']
 
 
+def _flavor_error(symbol: str) -> ValueError:
+    """
+    .. admonition:: flavor mismatch error
+
+        Build the error for combining FBools of different flavors.
+        Shared by the bitwise operators, which only check the flavors
+        inline.
+
+        :param symbol: The operator symbol.
+        :returns: The exception to raise.
+
+    """
+    return ValueError(f'Error: diffent flavored booleans compared with {symbol} operator')
+
+
 @final
 class FBool(SBool):
     """
@@ -36,85 +51,77 @@ class FBool(SBool):
 
     """
 
-    _falsy_dict: 'ClassVar[dict[Hashable, FBool]]' = {}
-    _falsy_dict_lock: ClassVar[threading.Lock] = threading.Lock()
+    _class_singletons: ClassVar[bool] = False
+    _singletons: 'ClassVar[dict[Hashable, FBool]]' = {}
 
-    _truthy_dict: 'ClassVar[dict[Hashable, FBool]]' = {}
-    _truthy_dict_lock: ClassVar[threading.Lock] = threading.Lock()
+    _falsy: FBool
+    _truthy: FBool
+    _flavor: Hashable
+    _repr: str
 
     def __new__(cls, witness: object, flavor: Hashable) -> Self:
         """
         .. admonition:: new
 
             Traditional singleton pattern but with a ClassVar dict
-            to store the for truthy or falsy singleton for each
-            hashable flavor.
+            to store the falsy singleton for each hashable flavor.
+            The falsy and truthy singletons of a flavor are created
+            together and linked to each other, and to their flavor,
+            before they are published, so no ``__init__`` is needed.
 
-            :param witness: Determines truthiness of the FBool instance returned.
-            :param flavor: The flavor of FBool to created.
-            :returns: The truthy or falsy FBool instance of a particular flavor.
+            .. note::
 
-        """
-        if witness:
-            if flavor not in cls._truthy_dict:
-                with cls._truthy_dict_lock:
-                    if flavor not in cls._truthy_dict:
-                        cls._truthy_dict[flavor] = super(SBool, cls).__new__(cls, 1)
-            return cls._truthy_dict[flavor]
-        else:
-            if flavor not in cls._falsy_dict:
-                with cls._falsy_dict_lock:
-                    if flavor not in cls._falsy_dict:
-                        cls._falsy_dict[flavor] = super(SBool, cls).__new__(cls, 0)
-            return cls._falsy_dict[flavor]
-
-    def __init__(self, witness: object, flavor: Hashable) -> None:
-        """
-        .. admonition:: initialize
-
-            Let the flavored boolean know its flavor.
+                No lock is needed, ``dict.setdefault`` is atomic. If
+                two threads race to create the same flavor, both get
+                the pair which made it into the dict first.
 
             :param witness: Determines truthiness of the FBool instance returned.
             :param flavor: The flavor of FBool to created.
-            :type flavor: H: Hashable
             :returns: The truthy or falsy FBool instance of a particular flavor.
-            :raises ValueError: If different flavors compared with bitwise operators.
 
         """
-        if not hasattr(self, '_flavor'):
-            self._flavor = flavor
+        try:
+            falsy = cls._singletons[flavor]
+        except KeyError:
+            if type(flavor) is str:
+                # equal strs from different callers then share one dict
+                # key, so later lookups with interned strs match on identity
+                flavor = sys.intern(flavor)
+            falsy = int.__new__(cls, 0)
+            truthy = int.__new__(cls, 1)
+            for fbool in falsy, truthy:
+                fbool._falsy = falsy
+                fbool._truthy = truthy
+                fbool._flavor = flavor
+                fbool._repr = f'FBool({bool(fbool)}, {flavor!r})'
+            falsy = cls._singletons.setdefault(flavor, falsy)
+        return falsy._truthy if witness else falsy
+
+    def __invert__(self) -> FBool:
+        return self._falsy if self else self._truthy
 
     def __and__(self, other: int) -> int:
-        if type(other) is type(self):
-            if other.flavor() != self._flavor:
-                msg = 'Error: diffent flavored booleans compared with & operator'
-                raise ValueError(msg)
-            if self and other:
-                return FBool(1, self._flavor)
-            else:
-                return FBool(0, self._flavor)
+        if type(other) is FBool:
+            flavor, other_flavor = self._flavor, other._flavor
+            if other_flavor is not flavor and other_flavor != flavor:
+                raise _flavor_error('&')
+            return self and other
         return super().__and__(other)
 
     def __or__(self, other: int) -> int:
-        if type(other) is type(self):
-            if other.flavor() != self.flavor():
-                msg = 'Error: diffent flavored booleans compared with | operator'
-                raise ValueError(msg)
-            if self or other:
-                return FBool(1, self._flavor)
-            else:
-                return FBool(0, self._flavor)
+        if type(other) is FBool:
+            flavor, other_flavor = self._flavor, other._flavor
+            if other_flavor is not flavor and other_flavor != flavor:
+                raise _flavor_error('|')
+            return self or other
         return super().__or__(other)
 
     def __xor__(self, other: int) -> int:
-        if type(other) is type(self):
-            if other.flavor() != self._flavor:
-                msg = 'Error: diffent flavored booleans compared with ^ operator'
-                raise ValueError(msg)
-            if (self or other) and not (self and other):
-                return FBool(1, self._flavor)
-            else:
-                return FBool(0, self._flavor)
+        if type(other) is FBool:
+            flavor, other_flavor = self._flavor, other._flavor
+            if other_flavor is not flavor and other_flavor != flavor:
+                raise _flavor_error('^')
+            return ~other if self else other
         return super().__xor__(other)
 
     def __repr__(self) -> str:
@@ -128,12 +135,12 @@ class FBool(SBool):
 
             Where repr_flavor = repr(self.flavor())
 
+            The string is computed once when the singleton is created.
+
             :returns: A String to reproduce the flavored boolean.
 
         """
-        if self:
-            return f'FBool(True, {repr(self._flavor)})'
-        return f'FBool(False, {repr(self._flavor)})'
+        return self._repr
 
     def __str__(self) -> str:
         """
@@ -176,7 +183,10 @@ def truthy(flavor: Hashable) -> FBool:
         :returns: The truthy singleton of a particular flavor.
 
     """
-    return FBool(True, flavor)
+    try:
+        return FBool._singletons[flavor]._truthy
+    except KeyError:
+        return FBool(True, flavor)
 
 
 def falsy(flavor: Hashable) -> FBool:
@@ -190,4 +200,7 @@ def falsy(flavor: Hashable) -> FBool:
         :returns: The falsy singleton of a particular flavor.
 
     """
-    return FBool(False, flavor)
+    try:
+        return FBool._singletons[flavor]
+    except KeyError:
+        return FBool(False, flavor)
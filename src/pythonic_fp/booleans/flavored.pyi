@@ -6,7 +6,7 @@ __all__ = ['FBool', 'truthy', 'falsy']
 
 class FBool(SBool):
     def __new__(cls, witness: object, flavor: Hashable) -> Self: ...
-    def __init__(self, witness: object, flavor: Hashable) -> None: ...
+    def __invert__(self) -> FBool: ...
     def __and__(self, other: int) -> int: ...
     def __or__(self, other: int) -> int: ...
     def __xor__(self, other: int) -> int: ...
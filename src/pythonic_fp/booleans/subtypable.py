@@ -12,15 +12,108 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import threading
-from collections.abc import Hashable
-from typing import cast, ClassVar, Final, overload, Self
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import ClassVar, Final, overload, Self
 from pythonic_fp.gadgets import first_common_ancestor as fca
 from pythonic_fp.gadgets.sentinels.novalue import NoValue
 
 __all__ = ['SBool', 'TRUTH', 'LIE']
 
 
+def _first_common_base(cls1: type, cls2: type) -> type | None:
+    """
+    .. admonition:: first common base
+
+        The inheritance hierarchy is fixed once the classes are created,
+        so ``_common_base`` caches the result for each pair of operand types.
+
+        When both operands are SBool subtypes, take the first class in
+        the MRO of ``cls1`` which is also an ancestor of ``cls2``. Only
+        fall back to the more general ``first_common_ancestor`` for
+        other types.
+
+        :param cls1: Type of the left operand, an SBool subtype.
+        :param cls2: Type of the right operand.
+        :returns: The base class for the result, None if no suitable one exists.
+
+    """
+    if issubclass(cls2, SBool):
+        ancestors = frozenset(cls2.__mro__)
+        for base in cls1.__mro__:
+            if base in ancestors:
+                return base
+
+    try:
+        return fca(cls1, cls2)
+    except TypeError:
+        if cls2 is bool:
+            return int
+        return None
+
+
+_common_base: Callable[[type, type], type | None] = lru_cache(maxsize=256)(_first_common_base)
+
+
+def _operand_error(symbol: str, left: object, right: object) -> TypeError:
+    """
+    .. admonition:: unsupported operand error
+
+        Build the error for an unsupported bitwise operation, worded
+        like the one Python itself raises. Kept out of the operators
+        so the formatting is only done on the failure path.
+
+        :param symbol: The operator symbol.
+        :param left: The left operand.
+        :param right: The right operand.
+        :returns: The exception to raise.
+
+    """
+    ltype = type(left).__name__
+    rtype = type(right).__name__
+    return TypeError(f"unsupported operand type(s) for {symbol}: '{ltype}' and '{rtype}'")
+
+
+def _mixed_bitop(
+    left: 'SBool',
+    right: int,
+    int_op: Callable[[int, int], int],
+    symbol: str,
+) -> int:
+    """
+    .. admonition:: mixed type bitwise operation
+
+        Shared slow path of the SBool bitwise operators, used when the
+        operands are not of the same type. The result is the truthy or
+        falsy singleton of their first common base class, or an int if
+        that base is not an SBool.
+
+        :param left: The SBool left operand.
+        :param right: The right operand.
+        :param int_op: The corresponding int method, like ``int.__and__``.
+        :param symbol: The operator symbol, used in error messages.
+        :returns: The result of the bitwise operation.
+        :raises TypeError: If the operands have no suitable common base.
+
+    """
+    right_type = type(right)
+    if right_type is bool or right_type is int:
+        return int_op(left, right)
+
+    base_class = _common_base(type(left), right_type)
+    if base_class is None:
+        raise _operand_error(symbol, left, right)
+
+    if issubclass(base_class, SBool):
+        if int_op(left, right):
+            return base_class._truthy
+        return base_class._falsy
+    elif base_class is int:
+        return int_op(left, right)
+    else:
+        return int_op(int(left), int(right))
+
+
 class SBool(int):
     """
     .. depricated:: 3.1.0
@@ -65,7 +158,7 @@ class SBool(int):
         .. note::
 
             These operators are contravariant, that is they will return
-            the instance of the latest common ancestor of their
+            the instance of the first common base class of their
             arguments. More specifically, the instance returned will
             have the type of the least upper bound in the inheritance
             graph of the classes of the two arguments.
@@ -78,11 +171,31 @@ class SBool(int):
 
     """
 
-    _falsy: 'ClassVar[SBool | NoValue]' = NoValue()
-    _falsy_lock: ClassVar[threading.Lock] = threading.Lock()
+    __slots__ = ()
+
+    # The falsy and truthy values an instance is one of, normally class
+    # attributes created by __init_subclass__. A subclass which clears
+    # _class_singletons provides them itself. Setting them per instance,
+    # as FBool does, needs an instance __dict__, so such a subclass must
+    # not declare __slots__. int subclasses cannot have nonempty ones.
+    _falsy: SBool
+    _truthy: SBool
+    _class_singletons: ClassVar[bool] = True
 
-    _truthy: 'ClassVar[SBool | NoValue]' = NoValue()
-    _truthy_lock: ClassVar[threading.Lock] = threading.Lock()
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """
+        .. admonition:: init subclass
+
+            Eagerly create the falsy and truthy singletons of each
+            subclass when the class itself is created. No lock is
+            needed, the class is not visible to any other code until
+            ``__init_subclass__`` returns.
+
+        """
+        super().__init_subclass__(**kwargs)
+        if cls._class_singletons:
+            cls._falsy = int.__new__(cls, 0)
+            cls._truthy = int.__new__(cls, 1)
 
     @overload
     def __new__(cls, witness: object) -> Self: ...
@@ -102,108 +215,29 @@ class SBool(int):
             :returns: The truthy or falsy SBool class instance.
 
         """
-        if witness:
-            if cls._truthy is NoValue():
-                with cls._truthy_lock:
-                    if cls._truthy is NoValue():
-                        cls._truthy = super().__new__(cls, 1)
-            return cast(SBool, cls._truthy)
-        else:
-            if cls._falsy is NoValue():
-                with cls._falsy_lock:
-                    if cls._falsy is NoValue():
-                        cls._falsy = super().__new__(cls, 0)
-            return cast(SBool, cls._falsy)
-
-    @overload
-    def __init__(self, witness: object) -> None: ...
-    @overload
-    def __init__(self, witness: object, flavor: Hashable) -> None: ...
-
-    def __init__(
-        self,
-        witness: object = False,
-        flavor: Hashable | NoValue = NoValue(),
-    ) -> None:
-        """
-        .. admonition:: init
-
-            :param witness: Determines the truthiness of the SBool.
-            :param flavor: Ignored by SBool, here only for support the
-                           Liskov Substitution Principle.
-        """
-        self._flavor: Hashable | NoValue = NoValue()
+        return cls._truthy if witness else cls._falsy
 
     def __invert__(self) -> int:
-        if self:
-            return type(self)(False, self._flavor)
-        return type(self)(True, self._flavor)
+        return self._falsy if self else self._truthy
 
     def __and__(self, other: int) -> int:
-        try:
-            base_class = fca(type(self), type(other))
-        except TypeError:
-            if type(other) is bool:
-                base_class = int
-            else:
-                msg = f"unsupported operand type(s) for &: '{type(self)}' and '{type(other)}'"
-                raise TypeError(msg)
-
-        if issubclass(base_class, SBool):
-            if self._flavor == cast(SBool, other)._flavor:
-                flavor = self._flavor
-            else:
-                flavor = NoValue()
-
-            if self and other:
-                return base_class(True, flavor)
-            return base_class(False, flavor)
-        else:
-            return int(self) & int(other)
+        if type(other) is type(self):
+            return self._truthy if self and other else self._falsy
+
+        return _mixed_bitop(self, other, int.__and__, '&')
 
     def __or__(self, other: int) -> int:
-        try:
-            base_class = fca(type(self), type(other))
-        except TypeError:
-            if type(other) is bool:
-                base_class = int
-            else:
-                msg = f"unsupported operand type(s) for |: '{type(self)}' and '{type(other)}'"
-                raise TypeError(msg)
-
-        if issubclass(base_class, SBool):
-            if self._flavor == cast(SBool, other)._flavor:
-                flavor = self._flavor
-            else:
-                flavor = NoValue()
-
-            if self or other:
-                return base_class(True, flavor)
-            return base_class(False, flavor)
-        else:
-            return int(self) | int(other)
+        if type(other) is type(self):
+            return self._truthy if self or other else self._falsy
+
+        return _mixed_bitop(self, other, int.__or__, '|')
 
     def __xor__(self, other: int) -> int:
-        try:
-            base_class = fca(type(self), type(other))
-        except TypeError:
-            if type(other) is bool:
-                base_class = int
-            else:
-                msg = f"unsupported operand type(s) for ^: '{type(self)}' and '{type(other)}'"
-                raise TypeError(msg)
-
-        if issubclass(base_class, SBool):
-            if self._flavor == cast(SBool, other)._flavor:
-                flavor = self._flavor
-            else:
-                flavor = NoValue()
-
-            if self and not other or other and not self:
-                return base_class(True, flavor)
-            return base_class(False, flavor)
-        else:
-            return int(self) ^ int(other)
+        # SBool values are always 0 or 1, so xor is just inequality
+        if type(other) is type(self):
+            return self._truthy if self != other else self._falsy
+
+        return _mixed_bitop(self, other, int.__xor__, '^')
 
     # override in derived classes
     def __repr__(self) -> str:
@@ -236,6 +270,9 @@ class SBool(int):
         return 'LIE'
 
 
+SBool._falsy = int.__new__(SBool, 0)
+SBool._truthy = int.__new__(SBool, 1)
+
 TRUTH: Final[SBool] = SBool(True)
 """
 .. admonition:: TRUTH
@@ -9,10 +9,6 @@ class SBool(int):
     def __new__(cls, witness: object) -> Self: ...
     @overload
     def __new__(cls, witness: object, flavor: Hashable | NoValue = ...) -> Self: ...
-    @overload
-    def __init__(self, witness: object) -> None: ...
-    @overload
-    def __init__(self, witness: object, flavor: Hashable) -> None: ...
     def __invert__(self) -> int: ...
     def __and__(self, other: int) -> int: ...
     def __or__(self, other: int) -> int: ...
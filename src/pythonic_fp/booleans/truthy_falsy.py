@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import threading
 from collections.abc import Hashable
-from typing import cast, ClassVar, Final, Self
+from typing import ClassVar, Final
 from pythonic_fp.gadgets.sentinels.novalue import NoValue
 from .subtypable import SBool
 
@@ -55,11 +54,15 @@ class TF_Bool(SBool):
 
     """
 
+    __slots__ = ()
+
+    _class_singletons: ClassVar[bool] = False
+
     def __new__(
         cls,
         witness: object,
         flavor: Hashable = NoValue(),
-    ) -> Self:
+    ) -> TF_Bool:
         """
         .. admonition:: new
 
@@ -69,13 +72,11 @@ class TF_Bool(SBool):
 
         """
         if witness:
-            return cast(Self, T_Bool())
-        return cast(Self, F_Bool())
+            return T_Bool._truthy
+        return F_Bool._falsy
 
     def __invert__(self) -> TF_Bool:
-        if self:
-            return F_Bool()
-        return T_Bool()
+        return F_Bool._falsy if self else T_Bool._truthy
 
     def __repr__(self) -> str:
         """
@@ -114,14 +115,16 @@ class T_Bool(TF_Bool):
          A distinct type from F_Bool.
 
     """
-    _truthy: 'ClassVar[T_Bool | NoValue]' = NoValue()
-    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    __slots__ = ()
+
+    _truthy: T_Bool
 
     def __new__(
         cls,
         witness: object = NoValue(),
         flavor: Hashable | NoValue = NoValue(),
-    ) -> Self:
+    ) -> T_Bool:
         """
         .. admonition:: new
 
@@ -130,11 +133,7 @@ class T_Bool(TF_Bool):
             :returns: The truthy T_Bool singleton instance.
 
         """
-        if cls._truthy is NoValue():
-            with cls._lock:
-                if cls._truthy is NoValue():
-                    cls._truthy = super(SBool, cls).__new__(cls, 1)
-        return cast(Self, cls._truthy)
+        return cls._truthy
 
     def __and__(self, other: int) -> int:
         if isinstance(other, TF_Bool):
@@ -148,9 +147,7 @@ class T_Bool(TF_Bool):
 
     def __xor__(self, other: int) -> int:
         if isinstance(other, TF_Bool):
-            if other:
-                return ~self
-            return self
+            return F_Bool._falsy if other else self
         return super().__xor__(other)
 
 
@@ -162,14 +159,16 @@ class F_Bool(TF_Bool):
          A distinct type from T_Bool.
 
     """
-    _falsy: 'ClassVar[F_Bool | NoValue]' = NoValue()
-    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    __slots__ = ()
+
+    _falsy: F_Bool
 
     def __new__(
         cls,
         witness: object = NoValue(),
         flavor: Hashable | NoValue = NoValue(),
-    ) -> Self:
+    ) -> F_Bool:
         """
         .. admonition:: new
 
@@ -178,30 +177,31 @@ class F_Bool(TF_Bool):
             :returns: The falsy F_Bool singleton instance.
 
         """
-        if cls._falsy is NoValue():
-            with cls._lock:
-                if cls._falsy is NoValue():
-                    cls._falsy = super(SBool, cls).__new__(cls, 0)
-        return cast(Self, cls._falsy)
+        return cls._falsy
 
     def __and__(self, other: int) -> int:
-        if issubclass(type(other), TF_Bool):
+        if isinstance(other, TF_Bool):
             return self
         return super().__and__(other)
 
     def __or__(self, other: int) -> int:
-        if issubclass(type(other), TF_Bool):
+        if isinstance(other, TF_Bool):
             return other
         return super().__or__(other)
 
     def __xor__(self, other: int) -> int:
-        if issubclass(type(other), TF_Bool):
-            if other:
-                return other
-            return self
+        if isinstance(other, TF_Bool):
+            # NEVER is the identity for xor
+            return other
         return super().__xor__(other)
 
 
+# All TF_Bool subclasses, including any user subclasses of T_Bool
+# and F_Bool, share these two singletons through TF_Bool.
+TF_Bool._truthy = int.__new__(T_Bool, 1)
+TF_Bool._falsy = int.__new__(F_Bool, 0)
+
+
 ALWAYS: Final[TF_Bool] = T_Bool()
 """
 .. admonition:: ALWAYS
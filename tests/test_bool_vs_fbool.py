@@ -193,3 +193,21 @@ class TestBooleanBehaviors():
         assert ft0 + SBool(1==1) + 3 == 5
         assert SBool('') + ff0 + ff0 == 0
         assert SBool('foo') + ft1 == 2
+
+    def test_bitwise(self) -> None:
+        ft1 = truthy(1)
+        ff1 = falsy(1)
+
+        assert ft1 ^ True == 0
+        assert ft1 ^ False == 1
+        assert ff1 ^ True == 1
+        assert ff1 ^ 3 == 3
+        assert ft1 ^ 3 == 2
+        assert ft1 | 2 == 3
+        assert ff1 | 2 == 2
+        assert ft1 & 3 == 1
+        assert ff1 & 3 == 0
+
+        assert type(ft1 ^ True) is int
+        assert type(ft1 | 2) is int
+        assert type(ff1 & True) is int
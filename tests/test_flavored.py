@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 from pythonic_fp.booleans.flavored import FBool, truthy, falsy
-from pythonic_fp.booleans.subtypable import TRUTH, LIE
+from pythonic_fp.booleans.subtypable import SBool
 
 t0_1 = FBool(1 == 1, 0)
 t0_2 = FBool(42 == 42, 0)
@@ -25,6 +26,15 @@ f0_2 = FBool(42 != 42, 0)
 f1_1 = FBool(0, 1)
 f1_2 = FBool('', 1)
 
+class Witness():
+    def __init__(self, truthiness: bool) -> None:
+        self.truthiness = truthiness
+        self.count = 0
+
+    def __bool__(self) -> bool:
+        self.count += 1
+        return self.truthiness
+
 class TestIdentiyFBoolEquality():
     def test_identity_fbool(self) -> None:
         # based on identity
@@ -100,6 +110,29 @@ class TestIdentiyFBoolEquality():
         truthy('foobar') != falsy('foobar')
         truthy('foobar') != falsy('foofoo')
 
+    def test_witness_evaluated_once(self) -> None:
+        yes = Witness(True)
+        no = Witness(False)
+        assert FBool(yes, 'witness') is truthy('witness')
+        assert FBool(no, 'witness') is falsy('witness')
+        assert FBool(yes, 'witness') is truthy('witness')
+        assert yes.count == 2
+        assert no.count == 1
+
+    def test_str_flavor_interned(self) -> None:
+        flavor1 = ''.join(['inter', 'ned'])
+        flavor2 = ''.join(['in', 'terned'])
+        assert flavor1 is not flavor2
+        assert truthy(flavor1) is truthy(flavor2)
+        assert truthy(flavor1).flavor() is sys.intern(flavor2)
+
+    def test_distinct_singletons(self) -> None:
+        # FBools compare like ints, so count distinct objects, not values
+        flavors = (0, 1, 'foo', 'bar', 42)
+        fbools = [FBool(v, f) for v in (True, False) for f in flavors]
+        assert len({id(fbool) for fbool in fbools}) == 2 * len(flavors)
+        assert len(set(fbools)) == 2
+
 class TestBitwiseOperations():
     def test_or_not(self) -> None:
         assert truthy(0) is (t0_1 | t0_1)
@@ -140,6 +173,26 @@ class TestBitwiseOperations():
         assert falsy(1) is ~(t1_1 ^ f1_2)
         assert falsy(1) is (f1_1 ^ f1_2)
 
+    def test_invert(self) -> None:
+        assert ~truthy('baz') is falsy('baz')
+        assert ~falsy('baz') is truthy('baz')
+        assert ~~truthy('baz') is truthy('baz')
+        assert ~~falsy('baz') is falsy('baz')
+        assert ~truthy('baz') is not falsy('foo')
+        assert ~(~t1_1 | f1_2) is t1_2
+
+    def test_generic_operators(self) -> None:
+        # the SBool operators, bypassing the FBool overrides
+        assert SBool.__and__(truthy('a'), truthy('a')) is truthy('a')
+        assert SBool.__and__(truthy('a'), falsy('a')) is falsy('a')
+        assert SBool.__or__(falsy('a'), falsy('a')) is falsy('a')
+        assert SBool.__or__(falsy('a'), truthy('a')) is truthy('a')
+        assert SBool.__xor__(truthy('a'), truthy('a')) is falsy('a')
+        assert SBool.__xor__(falsy('a'), truthy('a')) is truthy('a')
+        assert SBool.__invert__(truthy('a')) is falsy('a')
+        assert SBool.__invert__(falsy('a')) is truthy('a')
+        assert repr(SBool.__invert__(truthy('a'))) == "FBool(False, 'a')"
+
     def test_de_morgan(self) -> None:
         for fb1 in [truthy(0), falsy(0)]:
             for fb2 in [truthy(0), falsy(0)]:
@@ -155,3 +208,15 @@ class TestBitwiseOperations():
             for fb2 in [truthy(()), falsy(())]:
                 ~(fb1 & fb2) == (~fb1 | ~fb2)
                 ~(fb1 | fb2) == (~fb1 & ~fb2)
+
+class TestStrings():
+    def test_repr(self) -> None:
+        assert repr(t0_1) == 'FBool(True, 0)'
+        assert repr(f1_2) == 'FBool(False, 1)'
+        assert repr(truthy('foo')) == "FBool(True, 'foo')"
+        assert repr(~truthy('foo')) == "FBool(False, 'foo')"
+        assert eval(repr(falsy('bar'))) is falsy('bar')
+
+    def test_str(self) -> None:
+        assert str(t0_1) == 'FBool(True, 0)'
+        assert str(falsy('foo')) == 'FBool(False, foo)'
@@ -187,3 +187,22 @@ class TestTruthsAndLies:
         mooT is not yooT
         mooF is not yooF
         mooT is not yooF
+
+    def test_generic_operators(self) -> None:
+        # the SBool operators, bypassing the T_Bool/F_Bool overrides
+        assert SBool.__and__(ALWAYS, NEVER) is NEVER
+        assert SBool.__or__(ALWAYS, NEVER) is ALWAYS
+        assert SBool.__xor__(NEVER, ALWAYS) is ALWAYS
+        assert SBool.__xor__(ALWAYS, T_Bool()) is NEVER
+
+    def test_user_subclasses(self) -> None:
+        class MyT(T_Bool):
+            pass
+
+        class MyF(F_Bool):
+            pass
+
+        assert MyT() is ALWAYS
+        assert MyF() is NEVER
+        assert ~MyT() is NEVER
+        assert SBool.__and__(MyT(), MyF()) is NEVER
@@ -12,156 +12,99 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Callable
+from operator import and_, or_, xor
+import pytest
 from pythonic_fp.booleans.subtypable import SBool
 from pythonic_fp.booleans.flavored import FBool, truthy, falsy
 from pythonic_fp.booleans.truthy_falsy import TF_Bool, T_Bool, F_Bool
 
 
+BITWISE_OPS = [and_, or_, xor]
+OP_SYMBOLS = [(and_, '&'), (or_, '|'), (xor, '^')]
+
+sbt = SBool(True)
+sbf = SBool(False)
+fbt0 = FBool(True, 0)
+fbf0 = FBool(False, 0)
+fbt1 = FBool(True, 1)
+fbf1 = FBool(False, 1)
+fbt2 = FBool(True, 2)
+fbf2 = FBool(False, 2)
+tft = TF_Bool(True)
+tff = TF_Bool(False)
+tt = T_Bool()
+ff = F_Bool()
+
+FAMILIES = [(sbt, sbf), (fbt0, fbf0), (fbt1, fbf1), (tt, ff)]
+SINGLETONS = [x for family in FAMILIES for x in family]
+PAIRS = [(x, y) for family in FAMILIES for x in family for y in family]
+
+
 class TestInvert:
     def test_sbool(self) -> None:
-        assert ~SBool(True) is SBool(False)
-        assert ~SBool(False) is SBool(True)
+        assert ~sbt is sbf
+        assert ~sbf is sbt
 
     def test_fbool(self) -> None:
-        assert ~FBool(True, 0) is FBool(False, 0)
-        assert ~FBool(True, 0) is not FBool(False, 1)
-        assert ~FBool(False, 0) is FBool(True, 0)
-        assert ~FBool(False, 0) is not FBool(True, 1)
-
-        assert ~(FBool(False, 'foo') & FBool(False, 'foo')) is FBool(True, 'foo')
-        assert ~(FBool(True, 'foo') & FBool(False, 'foo')) is FBool(True, 'foo')
-        assert ~(FBool(False, 'foo') & FBool(True, 'foo')) is FBool(True, 'foo')
-        assert ~(FBool(True, 'foo') & FBool(True, 'foo')) is FBool(False, 'foo')
-        assert ~(FBool(False, 'foo') | FBool(False, 'foo')) is FBool(True, 'foo')
-        assert ~(FBool(True, 'foo') | FBool(False, 'foo')) is FBool(False, 'foo')
-        assert ~(FBool(False, 'foo') | FBool(True, 'foo')) is FBool(False, 'foo')
-        assert ~(FBool(True, 'foo') | FBool(True, 'foo')) is FBool(False, 'foo')
-        assert ~(FBool(False, 'foo') ^ FBool(False, 'foo')) is FBool(True, 'foo')
-        assert ~(FBool(True, 'foo') ^ FBool(False, 'foo')) is FBool(False, 'foo')
-        assert ~(FBool(False, 'foo') ^ FBool(True, 'foo')) is FBool(False, 'foo')
-        assert ~(FBool(True, 'foo') ^ FBool(True, 'foo')) is FBool(True, 'foo')
-
-        try:
-            ~(FBool(False, 'foo') & FBool(False, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with & operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(True, 'foo') & FBool(False, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with & operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(False, 'foo') & FBool(True, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with & operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(True, 'foo') & FBool(True, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with & operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(False, 'foo') | FBool(False, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with | operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(True, 'foo') | FBool(False, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with | operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(False, 'foo') | FBool(True, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with | operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(True, 'foo') | FBool(True, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with | operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(False, 'foo') ^ FBool(False, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with ^ operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(True, 'foo') ^ FBool(False, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with ^ operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(False, 'foo') ^ FBool(True, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with ^ operator'
-        else:
-            assert False
-
-        try:
-            ~(FBool(True, 'foo') ^ FBool(True, 'bar'))
-        except ValueError as err:
-            assert str(err) == 'Error: diffent flavored booleans compared with ^ operator'
+        assert ~fbt0 is fbf0
+        assert ~fbt0 is not fbf1
+        assert ~fbf0 is fbt0
+        assert ~fbf0 is not fbt1
 
+    def test_fbool_helpers(self) -> None:
         assert ~truthy(42) is falsy(42)
         assert ~falsy(42) is truthy(42)
         assert ~truthy(42) is not falsy(1)
         assert ~falsy(42) is not truthy(1)
 
+    @pytest.mark.parametrize('op', BITWISE_OPS)
+    @pytest.mark.parametrize('left', [False, True])
+    @pytest.mark.parametrize('right', [False, True])
+    def test_fbool_ops(self, op: Callable[[int, int], int], left: bool, right: bool) -> None:
+        expected = FBool(not op(left, right), 'foo')
+        assert ~op(FBool(left, 'foo'), FBool(right, 'foo')) is expected
+
+    @pytest.mark.parametrize('op, symbol', OP_SYMBOLS)
+    @pytest.mark.parametrize('left', [False, True])
+    @pytest.mark.parametrize('right', [False, True])
+    def test_fbool_flavor_mismatch(
+        self, op: Callable[[int, int], int], symbol: str, left: bool, right: bool
+    ) -> None:
+        with pytest.raises(ValueError) as excinfo:
+            ~op(FBool(left, 'foo'), FBool(right, 'bar'))
+        msg = f'Error: diffent flavored booleans compared with {symbol} operator'
+        assert str(excinfo.value) == msg
+
+    @pytest.mark.parametrize('x', SINGLETONS)
+    def test_involution(self, x: SBool) -> None:
+        assert ~~x is x
+        assert ~x is not x
+
+    @pytest.mark.parametrize('left, right', PAIRS)
+    def test_de_morgan(self, left: SBool, right: SBool) -> None:
+        assert ~(left & right) is (~left | ~right)
+        assert ~(left | right) is (~left & ~right)
+
     def test_truthy_falsy(self) -> None:
-        assert ~T_Bool() is F_Bool()
-        assert ~F_Bool() is T_Bool()
-        assert ~TF_Bool(True) is TF_Bool(False)
-        assert ~TF_Bool(False) is TF_Bool(True)
-
-    def test_sbool_fbool(self) -> None:
-        assert ~(SBool(False) & FBool(False, 'bar')) is SBool(True)
-        assert ~(FBool(True, 'foo') & SBool(False)) is SBool(True)
-        assert ~(SBool(False) & FBool(True, 'bar')) is SBool(True)
-        assert ~(FBool(True, 'foo') & SBool(True)) is SBool(False)
-        assert ~(SBool(False) | FBool(False, 'bar')) is SBool(True)
-        assert ~(FBool(True, 'foo') | SBool(False)) is SBool(False)
-        assert ~(SBool(False) | FBool(True, 'bar')) is SBool(False)
-        assert ~(FBool(True, 'foo') | SBool(True)) is SBool(False)
-        assert ~(SBool(False) ^ FBool(False, 'bar')) is SBool(True)
-        assert ~(FBool(True, 'foo') ^ SBool(False)) is SBool(False)
-        assert ~(SBool(False) ^ FBool(True, 'bar')) is SBool(False)
-        assert ~(FBool(True, 'foo') ^ SBool(True)) is SBool(True)
+        assert tft is tt
+        assert tff is ff
+        assert ~tt is ff
+        assert ~ff is tt
+        assert ~tft is tff
+        assert ~tff is tft
+
+    @pytest.mark.parametrize('op', BITWISE_OPS)
+    @pytest.mark.parametrize('left', [False, True])
+    @pytest.mark.parametrize('right', [False, True])
+    def test_sbool_fbool(self, op: Callable[[int, int], int], left: bool, right: bool) -> None:
+        expected = SBool(not op(left, right))
+        assert ~op(SBool(left), FBool(right, 'bar')) is expected
+        assert ~op(FBool(left, 'foo'), SBool(right)) is expected
 
 
 class TestArithmetic:
     def test_arithmetic(self) -> None:
-        sbt = SBool(1)
-        sbf = SBool(0)
-        fbt1 = FBool(1, 1)
-        fbf1 = FBool(0, 1)
-        fbt2 = FBool(1, 2)
-        fbf2 = FBool(0, 2)
-        tb1 = TF_Bool(1)
-        tb2 = TF_Bool(1)
-        fb1 = TF_Bool(0)
-        fb2 = TF_Bool(0)
-
-        sbt + (fbt1 + tb1) + tb2 == 4
-        sbt + (fbt1 - tb1) + fb2 == 1
-        (sbt + sbf) * (fbt1 + fbf1 + fbt2 + fbf2) * (tb1 + tb2 + fb1 + fb2) == 4
+        assert sbt + (fbt1 + tft) + tft == 4
+        assert sbt + (fbt1 - tft) + tff == 1
+        assert (sbt + sbf) * (fbt1 + fbf1 + fbt2 + fbf2) * (tft + tft + tff + tff) == 4
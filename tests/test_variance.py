@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pythonic_fp.booleans.truthy_falsy import TF_Bool, T_Bool, F_Bool, ALWAYS, NEVER
+from pythonic_fp.booleans.truthy_falsy import TF_Bool, ALWAYS, NEVER
 from pythonic_fp.booleans.flavored import FBool, truthy, falsy
 from pythonic_fp.booleans.subtypable import SBool, TRUTH, LIE
 
@@ -214,3 +214,44 @@ class TestFBoolWithTFBool():
         assert f_b1 ^ f_b2 is NEVER
         assert t_b1 ^ fbf2 is TRUTH
         assert fbf2 ^ t_b1 is TRUTH
+
+class Base_Bool(SBool):
+    pass
+
+class Left_Bool(Base_Bool):
+    pass
+
+class Right_Bool(Base_Bool):
+    pass
+
+class TestUserSubtypes():
+    def test_common_ancestor(self) -> None:
+        assert Left_Bool(1) & Right_Bool(1) is Base_Bool(1)
+        assert Left_Bool(1) & Right_Bool(0) is Base_Bool(0)
+        assert Right_Bool(0) | Left_Bool(1) is Base_Bool(1)
+        assert Right_Bool(1) ^ Left_Bool(1) is Base_Bool(0)
+        assert Left_Bool(1) & Left_Bool(1) is Left_Bool(1)
+        assert Left_Bool(1) & Base_Bool(1) is Base_Bool(1)
+        assert Left_Bool(1) | TRUTH is TRUTH
+        assert LIE ^ Right_Bool(1) is TRUTH
+        assert ~Left_Bool(1) is Left_Bool(0)
+        assert ~Left_Bool(0) is not Right_Bool(1)
+
+class TestUnsupportedOperands():
+    def test_str_operand(self) -> None:
+        for op, symbol in [(lambda x, y: x & y, '&'),
+                           (lambda x, y: x | y, '|'),
+                           (lambda x, y: x ^ y, '^')]:
+            try:
+                op(TRUTH, 'foo')
+            except TypeError as err:
+                assert str(err) == f"unsupported operand type(s) for {symbol}: 'SBool' and 'str'"
+            else:
+                assert False
+
+        try:
+            ALWAYS & 'foo'  # type: ignore
+        except TypeError as err:
+            assert str(err) == "unsupported operand type(s) for &: 'T_Bool' and 'str'"
+        else:
+            assert False